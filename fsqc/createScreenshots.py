@@ -164,47 +164,54 @@ def createScreenshots(
     if not (
         np.isin(
             list(range(231, 247)) + [801, 802, 803, 804, 805, 806, 807, 808, 809, 810],
-            lut[:, 0],
+            lut["id"],
         ).all()
     ):
         lutAdd = np.array(
-            (
-                [801, "L_hypothalamus_anterior_inferior", 250, 255, 50, 0],
-                [802, "L_hypothalamus_anterior_superior", 80, 200, 255, 0],
-                [803, "L_hypothalamus_posterior", 255, 160, 0, 0],
-                [804, "L_hypothalamus_tubular_inferior", 255, 160, 200, 0],
-                [805, "L_hypothalamus_tubular_superior", 20, 180, 130, 0],
-                [806, "R_hypothalamus_anterior_inferior", 250, 255, 50, 0],
-                [807, "R_hypothalamus_anterior_superior", 80, 200, 255, 0],
-                [808, "R_hypothalamus_posterior", 255, 160, 0, 0],
-                [809, "R_hypothalamus_tubular_inferior", 255, 160, 200, 0],
-                [810, "R_hypothalamus_tubular_superior", 20, 180, 130, 0],
-                [231, "HP_body", 0, 255, 0, 0],
-                [232, "HP_head", 255, 0, 0, 0],
-                [233, "presubiculum-head", 32, 0, 32, 0],
-                [234, "presubiculum-body", 64, 0, 64, 0],
-                [235, "subiculum-head", 0, 0, 175, 0],
-                [236, "subiculum-body", 0, 0, 255, 0],
-                [237, "CA1-head", 175, 75, 75, 0],
-                [238, "CA1-body", 255, 0, 0, 0],
-                [239, "CA3-head", 0, 80, 0, 0],
-                [240, "CA3-body", 0, 128, 0, 0],
-                [241, "CA4-head", 120, 90, 50, 0],
-                [242, "CA4-body", 196, 160, 128, 0],
-                [243, "GC-ML-DG-head", 75, 125, 175, 0],
-                [244, "GC-ML-DG-body", 32, 200, 255, 0],
-                [245, "molecular_layer_HP-head", 100, 25, 25, 0],
-                [246, "molecular_layer_HP-body", 128, 0, 0, 0],
-            ),
-            dtype=object,
+            [
+                (801, "L_hypothalamus_anterior_inferior", 250, 255, 50, 0),
+                (802, "L_hypothalamus_anterior_superior", 80, 200, 255, 0),
+                (803, "L_hypothalamus_posterior", 255, 160, 0, 0),
+                (804, "L_hypothalamus_tubular_inferior", 255, 160, 200, 0),
+                (805, "L_hypothalamus_tubular_superior", 20, 180, 130, 0),
+                (806, "R_hypothalamus_anterior_inferior", 250, 255, 50, 0),
+                (807, "R_hypothalamus_anterior_superior", 80, 200, 255, 0),
+                (808, "R_hypothalamus_posterior", 255, 160, 0, 0),
+                (809, "R_hypothalamus_tubular_inferior", 255, 160, 200, 0),
+                (810, "R_hypothalamus_tubular_superior", 20, 180, 130, 0),
+                (231, "HP_body", 0, 255, 0, 0),
+                (232, "HP_head", 255, 0, 0, 0),
+                (233, "presubiculum-head", 32, 0, 32, 0),
+                (234, "presubiculum-body", 64, 0, 64, 0),
+                (235, "subiculum-head", 0, 0, 175, 0),
+                (236, "subiculum-body", 0, 0, 255, 0),
+                (237, "CA1-head", 175, 75, 75, 0),
+                (238, "CA1-body", 255, 0, 0, 0),
+                (239, "CA3-head", 0, 80, 0, 0),
+                (240, "CA3-body", 0, 128, 0, 0),
+                (241, "CA4-head", 120, 90, 50, 0),
+                (242, "CA4-body", 196, 160, 128, 0),
+                (243, "GC-ML-DG-head", 75, 125, 175, 0),
+                (244, "GC-ML-DG-body", 32, 200, 255, 0),
+                (245, "molecular_layer_HP-head", 100, 25, 25, 0),
+                (246, "molecular_layer_HP-body", 128, 0, 0, 0),
+            ],
+            dtype=lut.dtype,
         )
 
         lut = np.concatenate((lut, lutAdd), axis=0)
 
-    lutEnum = dict(zip(lut[:, 0], range(len(lut[:, 0]))))
+    # dense mapping from label ids to rows of the lut (-1 for unknown ids), so that
+    # a label volume can be mapped to lutMap indices with a single gather
 
-    lutTab = np.array(lut[:, (2, 3, 4, 5)] / 255, dtype="float32")
-    lutTab[:, 3] = 1
+    lutRows = np.full(lut["id"].max() + 1, -1, dtype=int)
+    lutRows[lut["id"]] = np.arange(len(lut))
+
+    # the alpha values of the lut are not used, all colors are fully opaque
+    lutTab = np.ones((len(lut), 4), dtype="float32")
+    lutTab[:, 0] = lut["r"] / 255
+    lutTab[:, 1] = lut["g"] / 255
+    lutTab[:, 2] = lut["b"] / 255
 
     lutMap = matplotlib.colors.ListedColormap(lutTab)
 
@@ -298,11 +305,20 @@ def createScreenshots(
         if BINARIZE is True:
             asegData = (asegData > 0).astype(int)
 
-        asegUnique, asegIdx = np.unique(asegData, return_inverse=True)
+        # map labels to rows of the lut (i.e., indices into lutMap)
+        asegLabels = asegData.astype(int)
+
+        asegKnown = (
+            (asegLabels == asegData) & (asegLabels >= 0) & (asegLabels < len(lutRows))
+        )
 
-        asegEnum = np.array([lutEnum[x] for x in asegUnique])
+        asegVals = np.where(asegKnown, lutRows[np.where(asegKnown, asegLabels, 0)], -1)
 
-        asegVals = np.reshape(asegEnum[asegIdx], (aseg.shape))
+        if (asegVals < 0).any():
+            raise KeyError(
+                "ERROR: labels not found in color LUT: "
+                + str(np.unique(asegData[asegVals < 0]).tolist())
+            )
 
     # -----------------------------------------------------------------------------
     # compile image data for plotting
@@ -565,25 +581,11 @@ def createScreenshots(
                 logging.info("Surface " + str(s))
 
                 # create array of line segments
-                tmpx = list()
-                tmpy = list()
-
-                for i in range(len(LVL[s][p][1][0])):
-                    tmpx.append(
-                        (
-                            LVL[s][p][0][0][LVL[s][p][1][0][i][0] - 1][dims[0]],
-                            LVL[s][p][0][0][LVL[s][p][1][0][i][1] - 1][dims[0]],
-                        )
-                    )
-                    tmpy.append(
-                        (
-                            LVL[s][p][0][0][LVL[s][p][1][0][i][0] - 1][dims[1]],
-                            LVL[s][p][0][0][LVL[s][p][1][0][i][1] - 1][dims[1]],
-                        )
-                    )
+                tmpv = LVL[s][p][0][0]
+                tmpl = LVL[s][p][1][0] - 1
 
-                tmpx = np.array(tmpx)
-                tmpy = np.array(tmpy)
+                tmpx = tmpv[tmpl, dims[0]]
+                tmpy = tmpv[tmpl, dims[1]]
 
                 # remove duplicate points
                 tmpxy = np.unique(np.concatenate((tmpx, tmpy), axis=1), axis=0)
@@ -65,43 +65,39 @@ def evaluateFornixSegmentation(
     from fsqc.createScreenshots import createScreenshots
     from fsqc.fsqcUtils import applyTransform, binarizeImage
 
+    # --------------------------------------------------------------------------
+    # set paths
+
+    lta_file = os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "transforms", "cc_up.lta")
+    aseg_file = os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "aseg.mgz")
+    norm_file = os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "norm.mgz")
+    aseg_up_file = os.path.join(OUTPUT_DIR, "asegCCup.mgz")
+    norm_up_file = os.path.join(OUTPUT_DIR, "normCCup.mgz")
+    cc_file = os.path.join(OUTPUT_DIR, "cc.mgz")
+
     # --------------------------------------------------------------------------
     # check files
 
     logging.captureWarnings(True)
 
-    if not os.path.isfile(
-        os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "transforms", "cc_up.lta")
-    ):
-        warnings.warn(
-            "WARNING: could not find "
-            + os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "transforms", "cc_up.lta")
-            + ", returning NaNs"
-        )
+    if not os.path.isfile(lta_file):
+        warnings.warn("WARNING: could not find " + lta_file + ", returning NaNs")
 
         out = np.empty(N_EIGEN)
         out[:] = np.nan
 
         return out
 
-    elif not os.path.isfile(os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "aseg.mgz")):
-        warnings.warn(
-            "WARNING: could not find "
-            + os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "aseg.mgz")
-            + ", returning NaNs"
-        )
+    elif not os.path.isfile(aseg_file):
+        warnings.warn("WARNING: could not find " + aseg_file + ", returning NaNs")
 
         out = np.empty(N_EIGEN)
         out[:] = np.nan
 
         return out
 
-    elif not os.path.isfile(os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "norm.mgz")):
-        warnings.warn(
-            "WARNING: could not find "
-            + os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "norm.mgz")
-            + ", returning NaNs"
-        )
+    elif not os.path.isfile(norm_file):
+        warnings.warn("WARNING: could not find " + norm_file + ", returning NaNs")
 
         out = np.empty(N_EIGEN)
         out[:] = np.nan
@@ -114,36 +110,22 @@ def evaluateFornixSegmentation(
     # --------------------------------------------------------------------------
     # conduct transform for aseg and norm
 
-    applyTransform(
-        os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "aseg.mgz"),
-        os.path.join(OUTPUT_DIR, "asegCCup.mgz"),
-        mat_file=os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "transforms", "cc_up.lta"),
-        interp="nearest",
-    )
+    applyTransform(aseg_file, aseg_up_file, mat_file=lta_file, interp="nearest")
 
     # when using 'make_upright', conducting the transform for norm.mgz is no
     # longer necessary (and will produce the same results)
 
-    applyTransform(
-        os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "norm.mgz"),
-        os.path.join(OUTPUT_DIR, "normCCup.mgz"),
-        mat_file=os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "transforms", "cc_up.lta"),
-        interp="cubic",
-    )
+    applyTransform(norm_file, norm_up_file, mat_file=lta_file, interp="cubic")
 
     # create fornix mask
 
-    binarizeImage(
-        os.path.join(OUTPUT_DIR, "asegCCup.mgz"),
-        os.path.join(OUTPUT_DIR, "cc.mgz"),
-        match=[251, 252, 253, 254, 255],
-    )
+    binarizeImage(aseg_up_file, cc_file, match=[251, 252, 253, 254, 255])
 
     # --------------------------------------------------------------------------
     # create screenshot
 
     if CREATE_SCREENSHOT is True:
-        hdr = nb.load(os.path.join(OUTPUT_DIR, "asegCCup.mgz"))
+        hdr = nb.load(aseg_up_file)
         x_coord = np.matmul(
             hdr.header.get_vox2ras_tkr(), np.array((128, 128, 128, 1))[:, np.newaxis]
         )[0]
@@ -154,8 +136,8 @@ def evaluateFornixSegmentation(
             INTERACTIVE=False,
             VIEWS=[("x", x_coord - 1), ("x", x_coord), ("x", x_coord + 1)],
             LAYOUT=(1, 3),
-            BASE=[os.path.join(OUTPUT_DIR, "normCCup.mgz")],
-            OVERLAY=[os.path.join(OUTPUT_DIR, "cc.mgz")],
+            BASE=[norm_up_file],
+            OVERLAY=[cc_file],
             SURF=None,
             OUTFILE=SCREENSHOTS_OUTFILE,
         )
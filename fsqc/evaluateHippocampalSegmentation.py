@@ -68,35 +68,30 @@ def evaluateHippocampalSegmentation(
     from fsqc.createScreenshots import createScreenshots
     from fsqc.fsqcUtils import binarizeImage
 
+    # --------------------------------------------------------------------------
+    # set paths
+
+    norm_file = os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "norm.mgz")
+    seg_file = os.path.join(
+        SUBJECTS_DIR,
+        SUBJECT,
+        "mri",
+        HEMI + ".hippoAmygLabels-" + LABEL + ".FSvoxelSpace.mgz",
+    )
+
     # --------------------------------------------------------------------------
     # check files
 
-    if not os.path.isfile(os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "norm.mgz")):
+    if not os.path.isfile(norm_file):
         logging.error(
-            "ERROR: could not find "
-            + os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "norm.mgz")
-            + ", not running hippocampus module."
+            "ERROR: could not find " + norm_file + ", not running hippocampus module."
         )
 
         raise ValueError("File not found")
 
-    if not os.path.isfile(
-        os.path.join(
-            SUBJECTS_DIR,
-            SUBJECT,
-            "mri",
-            HEMI + ".hippoAmygLabels-" + LABEL + ".FSvoxelSpace.mgz",
-        )
-    ):
+    if not os.path.isfile(seg_file):
         logging.error(
-            "ERROR: could not find "
-            + os.path.join(
-                SUBJECTS_DIR,
-                SUBJECT,
-                "mri",
-                HEMI + ".hippoAmygLabels-" + LABEL + ".FSvoxelSpace.mgz",
-            )
-            + ", not running hippocampus module."
+            "ERROR: could not find " + seg_file + ", not running hippocampus module."
         )
 
         raise ValueError("File not found")
@@ -108,12 +103,7 @@ def evaluateHippocampalSegmentation(
     # create mask
 
     binarizeImage(
-        os.path.join(
-            SUBJECTS_DIR,
-            SUBJECT,
-            "mri",
-            HEMI + ".hippoAmygLabels-" + LABEL + ".FSvoxelSpace.mgz",
-        ),
+        seg_file,
         os.path.join(OUTPUT_DIR, "hippocampus-" + HEMI + ".mgz"),
         match=None,
     )
@@ -121,14 +111,7 @@ def evaluateHippocampalSegmentation(
     # --------------------------------------------------------------------------
     # get centroids
 
-    seg = nb.load(
-        os.path.join(
-            SUBJECTS_DIR,
-            SUBJECT,
-            "mri",
-            HEMI + ".hippoAmygLabels-" + LABEL + ".FSvoxelSpace.mgz",
-        )
-    )
+    seg = nb.load(seg_file)
     seg_data = seg.get_fdata()
     seg_labels = np.setdiff1d(np.unique(seg_data), 0)
 
@@ -174,15 +157,8 @@ def evaluateHippocampalSegmentation(
             INTERACTIVE=False,
             VIEWS=[("x", ctr_tkr_x0), ("y", ctr_tkr_y0), ("z", ctr_tkr_z0)],
             LAYOUT=(1, 3),
-            BASE=[os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "norm.mgz")],
-            OVERLAY=[
-                os.path.join(
-                    SUBJECTS_DIR,
-                    SUBJECT,
-                    "mri",
-                    HEMI + ".hippoAmygLabels-" + LABEL + ".FSvoxelSpace.mgz",
-                )
-            ],
+            BASE=[norm_file],
+            OVERLAY=[seg_file],
             SURF=None,
             OUTFILE=SCREENSHOTS_OUTFILE,
             ORIENTATION=SCREENSHOTS_ORIENTATION,
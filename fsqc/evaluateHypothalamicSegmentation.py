@@ -63,27 +63,27 @@ def evaluateHypothalamicSegmentation(
     from fsqc.createScreenshots import createScreenshots
     from fsqc.fsqcUtils import binarizeImage
 
+    # --------------------------------------------------------------------------
+    # set paths
+
+    norm_file = os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "norm.mgz")
+    seg_file = os.path.join(
+        SUBJECTS_DIR, SUBJECT, "mri", "hypothalamic_subunits_seg.v1.mgz"
+    )
+
     # --------------------------------------------------------------------------
     # check files
 
-    if not os.path.isfile(os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "norm.mgz")):
+    if not os.path.isfile(norm_file):
         logging.error(
-            "ERROR: could not find "
-            + os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "norm.mgz")
-            + ", not running hypothalamus module."
+            "ERROR: could not find " + norm_file + ", not running hypothalamus module."
         )
 
         raise ValueError("File not found")
 
-    if not os.path.isfile(
-        os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "hypothalamic_subunits_seg.v1.mgz")
-    ):
+    if not os.path.isfile(seg_file):
         logging.error(
-            "ERROR: could not find "
-            + os.path.join(
-                SUBJECTS_DIR, SUBJECT, "mri", "hypothalamic_subunits_seg.v1.mgz"
-            )
-            + ", not running hypothalamus module."
+            "ERROR: could not find " + seg_file + ", not running hypothalamus module."
         )
 
         raise ValueError("File not found")
@@ -95,7 +95,7 @@ def evaluateHypothalamicSegmentation(
     # create mask
 
     binarizeImage(
-        os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "hypothalamic_subunits_seg.v1.mgz"),
+        seg_file,
         os.path.join(OUTPUT_DIR, "hypothalamus.mgz"),
         match=[801, 802, 803, 804, 805, 806, 807, 808, 809, 810],
     )
@@ -103,9 +103,7 @@ def evaluateHypothalamicSegmentation(
     # --------------------------------------------------------------------------
     # get centroids
 
-    seg = nb.load(
-        os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "hypothalamic_subunits_seg.v1.mgz")
-    )
+    seg = nb.load(seg_file)
     seg_data = seg.get_fdata()
     seg_labels = np.setdiff1d(np.unique(seg_data), 0)
 
@@ -246,12 +244,8 @@ def evaluateHypothalamicSegmentation(
                 ("z", ctr_tkr_z1),
             ],
             LAYOUT=(1, 9),
-            BASE=[os.path.join(SUBJECTS_DIR, SUBJECT, "mri", "norm.mgz")],
-            OVERLAY=[
-                os.path.join(
-                    SUBJECTS_DIR, SUBJECT, "mri", "hypothalamic_subunits_seg.v1.mgz"
-                )
-            ],
+            BASE=[norm_file],
+            OVERLAY=[seg_file],
             SURF=None,
             OUTFILE=SCREENSHOTS_OUTFILE,
             ORIENTATION=SCREENSHOTS_ORIENTATION,
@@ -446,7 +446,8 @@ def _parse_arguments():
     )
 
     optional = parser.add_argument_group("optional arguments")
-    optional.add_argument(
+    subjects = optional.add_mutually_exclusive_group()
+    subjects.add_argument(
         "--subjects",
         dest="subjects",
         help="list of subject IDs. If omitted, all suitable sub-directories within the subjects directory will be used.",
@@ -455,7 +456,7 @@ def _parse_arguments():
         metavar="SubjectID",
         required=False,
     )
-    optional.add_argument(
+    subjects.add_argument(
         "--subjects-file",
         dest="subjects_file",
         help="filename with list of subject IDs (one per line). If omitted, all suitable sub-directories within the subjects directory will be used.",
@@ -667,6 +668,7 @@ def _parse_arguments():
         help=argparse.SUPPRESS,
         default=["radiological"],
         nargs=1,
+        choices=["neurological", "radiological"],
         metavar="<neurological|radiological>",
         required=False,
     )  # this is currently a hidden "expert" option
@@ -698,42 +700,55 @@ def _parse_arguments():
         get_help()
         return None
 
-    # prepare output
-    argsDict = dict()
-    argsDict["subjects_dir"] = args.subjects_dir
-    argsDict["output_dir"] = args.output_dir
-    argsDict["subjects"] = args.subjects
-    argsDict["subjects_file"] = args.subjects_file
-    argsDict["shape"] = args.shape
-    argsDict["screenshots"] = args.screenshots
-    argsDict["screenshots_html"] = args.screenshots_html
-    argsDict["screenshots_base"] = args.screenshots_base
-    argsDict["screenshots_overlay"] = args.screenshots_overlay
-    argsDict["screenshots_surf"] = args.screenshots_surf
-    argsDict["screenshots_views"] = args.screenshots_views
-    argsDict["screenshots_layout"] = args.screenshots_layout
-    argsDict["screenshots_orientation"] = args.screenshots_orientation
-    argsDict["surfaces"] = args.surfaces
-    argsDict["surfaces_html"] = args.surfaces_html
-    argsDict["surfaces_views"] = args.surfaces_views
-    argsDict["skullstrip"] = args.skullstrip
-    argsDict["skullstrip_html"] = args.skullstrip_html
-    argsDict["fornix"] = args.fornix
-    argsDict["fornix_html"] = args.fornix_html
-    argsDict["hypothalamus"] = args.hypothalamus
-    argsDict["hypothalamus_html"] = args.hypothalamus_html
-    argsDict["hippocampus"] = args.hippocampus
-    argsDict["hippocampus_html"] = args.hippocampus_html
-    argsDict["hippocampus_label"] = args.hippocampus_label
-    argsDict["outlier"] = args.outlier
-    argsDict["outlier_table"] = args.outlier_table
-    argsDict["fastsurfer"] = args.fastsurfer
-    argsDict["exit_on_error"] = args.exit_on_error
+    # prepare output: the argument destinations are the keys of argsDict
+    argsDict = vars(args)
+    argsDict.pop("more_help")
 
     #
     return argsDict
 
 
+# ------------------------------------------------------------------------------
+# check output subdirectory
+
+
+def _check_output_subdirectory(output_dir, subdir):
+    """
+    Check if an output subdirectory exists or can be created and is writable.
+
+    Parameters
+    ----------
+    output_dir : str
+        Output directory.
+    subdir : str
+        Name of the subdirectory within the output directory.
+
+    Raises
+    ------
+    PermissionError
+        If the subdirectory is not writable.
+    """
+    # imports
+    import logging
+    import os
+
+    path = os.path.join(output_dir, subdir)
+
+    if os.path.isdir(path):
+        logging.info("Found " + subdir + " directory " + path)
+        return
+
+    try:
+        os.makedirs(path, exist_ok=True)
+    except Exception as e:
+        logging.error("ERROR: cannot create " + subdir + " directory " + path)
+        logging.error("Reason: " + str(e))
+        raise
+
+    if not os.access(path, os.W_OK | os.X_OK):
+        raise PermissionError("ERROR: " + path + " not writeable")
+
+
 # ------------------------------------------------------------------------------
 # check arguments
 
@@ -769,7 +784,6 @@ def _check_arguments(argsDict):
 
     import logging
     import os
-    import tempfile
     import warnings
 
     logging.captureWarnings(True)
@@ -820,35 +834,7 @@ def _check_arguments(argsDict):
 
     # check if screenshots subdirectory exists or can be created and is writable
     if argsDict["screenshots"] is True or argsDict["screenshots_html"] is True:
-        if os.path.isdir(os.path.join(argsDict["output_dir"], "screenshots")):
-            logging.info(
-                "Found screenshots directory "
-                + os.path.join(argsDict["output_dir"], "screenshots")
-            )
-        else:
-            try:
-                os.mkdir(os.path.join(argsDict["output_dir"], "screenshots"))
-            except Exception as e:
-                logging.error(
-                    "ERROR: cannot create screenshots directory "
-                    + os.path.join(argsDict["output_dir"], "screenshots")
-                )
-                logging.error("Reason: " + str(e))
-                raise
-
-            try:
-                testfile = tempfile.TemporaryFile(
-                    dir=os.path.join(argsDict["output_dir"], "screenshots")
-                )
-                testfile.close()
-            except Exception as e:
-                logging.error(
-                    "ERROR: "
-                    + os.path.join(argsDict["output_dir"], "screenshots")
-                    + " not writeable"
-                )
-                logging.error("Reason: " + str(e))
-                raise
+        _check_output_subdirectory(argsDict["output_dir"], "screenshots")
 
     # check screenshots_base
     argsDict["screenshots_base"] = [argsDict["screenshots_base"]]
@@ -871,14 +857,13 @@ def _check_arguments(argsDict):
     if argsDict["screenshots_views"] == "default":
         argsDict["screenshots_views"] = [argsDict["screenshots_views"]]
     else:
+        screenshots_views = list()
         for x in argsDict["screenshots_views"]:
-            isXYZ = (
-                x.split("=")[0] == "x"
-                or x.split("=")[0] == "y"
-                or x.split("=")[0] == "z"
-            )
+            # split each expression only once and keep the converted result
+            dim, _, coord = x.partition("=")
+            isXYZ = dim in ("x", "y", "z")
             try:
-                int(x.split("=")[1])
+                screenshots_views.append((dim, int(coord)))
                 isConvertible = True
             except Exception:
                 isConvertible = False
@@ -895,10 +880,7 @@ def _check_arguments(argsDict):
         logging.info(
             "Found screenshot coordinates " + " ".join(argsDict["screenshots_views"])
         )
-        argsDict["screenshots_views"] = [
-            (y[0], int(y[1]))
-            for y in [x.split("=") for x in argsDict["screenshots_views"]]
-        ]
+        argsDict["screenshots_views"] = screenshots_views
 
     # check screenshots_layout
     if argsDict["screenshots_layout"] is not None:
@@ -926,131 +908,19 @@ def _check_arguments(argsDict):
 
     # check if skullstrip subdirectory exists or can be created and is writable
     if argsDict["skullstrip"] is True or argsDict["skullstrip_html"] is True:
-        if os.path.isdir(os.path.join(argsDict["output_dir"], "skullstrip")):
-            logging.info(
-                "Found skullstrip directory "
-                + os.path.join(argsDict["output_dir"], "skullstrip")
-            )
-        else:
-            try:
-                os.mkdir(os.path.join(argsDict["output_dir"], "skullstrip"))
-            except Exception as e:
-                logging.error(
-                    "ERROR: cannot create skullstrip directory "
-                    + os.path.join(argsDict["output_dir"], "skullstrip")
-                )
-                logging.error("Reason: " + str(e))
-                raise
-
-            try:
-                testfile = tempfile.TemporaryFile(
-                    dir=os.path.join(argsDict["output_dir"], "skullstrip")
-                )
-                testfile.close()
-            except Exception as e:
-                logging.error(
-                    "ERROR: "
-                    + os.path.join(argsDict["output_dir"], "skullstrip")
-                    + " not writeable"
-                )
-                logging.error("Reason: " + str(e))
-                raise
+        _check_output_subdirectory(argsDict["output_dir"], "skullstrip")
 
     # check if fornix subdirectory exists or can be created and is writable
     if argsDict["fornix"] is True or argsDict["fornix_html"] is True:
-        if os.path.isdir(os.path.join(argsDict["output_dir"], "fornix")):
-            logging.info(
-                "Found fornix directory "
-                + os.path.join(argsDict["output_dir"], "fornix")
-            )
-        else:
-            try:
-                os.mkdir(os.path.join(argsDict["output_dir"], "fornix"))
-            except Exception as e:
-                logging.error(
-                    "ERROR: cannot create fornix directory "
-                    + os.path.join(argsDict["output_dir"], "fornix")
-                )
-                logging.error("Reason: " + str(e))
-                raise
-
-            try:
-                testfile = tempfile.TemporaryFile(
-                    dir=os.path.join(argsDict["output_dir"], "fornix")
-                )
-                testfile.close()
-            except Exception as e:
-                logging.error(
-                    "ERROR: "
-                    + os.path.join(argsDict["output_dir"], "fornix")
-                    + " not writeable"
-                )
-                logging.error("Reason: " + str(e))
-                raise
+        _check_output_subdirectory(argsDict["output_dir"], "fornix")
 
     # check if hypothalamus subdirectory exists or can be created and is writable
     if argsDict["hypothalamus"] is True or argsDict["hypothalamus_html"] is True:
-        if os.path.isdir(os.path.join(argsDict["output_dir"], "hypothalamus")):
-            logging.info(
-                "Found hypothalamus directory "
-                + os.path.join(argsDict["output_dir"], "hypothalamus")
-            )
-        else:
-            try:
-                os.mkdir(os.path.join(argsDict["output_dir"], "hypothalamus"))
-            except Exception as e:
-                logging.error(
-                    "ERROR: cannot create hypothalamus directory "
-                    + os.path.join(argsDict["output_dir"], "hypothalamus")
-                )
-                logging.error("Reason: " + str(e))
-                raise
-
-            try:
-                testfile = tempfile.TemporaryFile(
-                    dir=os.path.join(argsDict["output_dir"], "hypothalamus")
-                )
-                testfile.close()
-            except Exception as e:
-                logging.error(
-                    "ERROR: "
-                    + os.path.join(argsDict["output_dir"], "hypothalamus")
-                    + " not writeable"
-                )
-                logging.error("Reason: " + str(e))
-                raise
+        _check_output_subdirectory(argsDict["output_dir"], "hypothalamus")
 
     # check if hippocampus subdirectory exists or can be created and is writable
     if argsDict["hippocampus"] is True or argsDict["hippocampus_html"] is True:
-        if os.path.isdir(os.path.join(argsDict["output_dir"], "hippocampus")):
-            logging.info(
-                "Found hippocampus directory "
-                + os.path.join(argsDict["output_dir"], "hippocampus")
-            )
-        else:
-            try:
-                os.mkdir(os.path.join(argsDict["output_dir"], "hippocampus"))
-            except Exception as e:
-                logging.error(
-                    "ERROR: cannot create hippocampus directory "
-                    + os.path.join(argsDict["output_dir"], "hippocampus")
-                )
-                logging.error("Reason: " + str(e))
-                raise
-
-            try:
-                testfile = tempfile.TemporaryFile(
-                    dir=os.path.join(argsDict["output_dir"], "hippocampus")
-                )
-                testfile.close()
-            except Exception as e:
-                logging.error(
-                    "ERROR: "
-                    + os.path.join(argsDict["output_dir"], "hippocampus")
-                    + " not writeable"
-                )
-                logging.error("Reason: " + str(e))
-                raise
+        _check_output_subdirectory(argsDict["output_dir"], "hippocampus")
 
     # check if label file is given
     if (
@@ -1066,67 +936,11 @@ def _check_arguments(argsDict):
 
     # check if shape subdirectory exists or can be created and is writable
     if argsDict["shape"] is True:
-        if os.path.isdir(os.path.join(argsDict["output_dir"], "brainprint")):
-            logging.info(
-                "Found brainprint directory "
-                + os.path.join(argsDict["output_dir"], "brainprint")
-            )
-        else:
-            try:
-                os.makedirs(os.path.join(argsDict["output_dir"], "brainprint"))
-            except Exception as e:
-                logging.error(
-                    "ERROR: cannot create brainprint directory "
-                    + os.path.join(argsDict["output_dir"], "brainprint")
-                )
-                logging.error("Reason: " + str(e))
-                raise
-
-            try:
-                testfile = tempfile.TemporaryFile(
-                    dir=os.path.join(argsDict["output_dir"], "brainprint")
-                )
-                testfile.close()
-            except Exception as e:
-                logging.error(
-                    "ERROR: "
-                    + os.path.join(argsDict["output_dir"], "brainprint")
-                    + " not writeable"
-                )
-                logging.error("Reason: " + str(e))
-                raise
+        _check_output_subdirectory(argsDict["output_dir"], "brainprint")
 
     # check if outlier subdirectory exists or can be created and is writable
     if argsDict["outlier"] is True:
-        if os.path.isdir(os.path.join(argsDict["output_dir"], "outliers")):
-            logging.info(
-                "Found outliers directory "
-                + os.path.join(argsDict["output_dir"], "outliers")
-            )
-        else:
-            try:
-                os.makedirs(os.path.join(argsDict["output_dir"], "outliers"))
-            except Exception as e:
-                logging.error(
-                    "ERROR: cannot create outliers directory "
-                    + os.path.join(argsDict["output_dir"], "outliers")
-                )
-                logging.error("Reason: " + str(e))
-                raise
-
-            try:
-                testfile = tempfile.TemporaryFile(
-                    dir=os.path.join(argsDict["output_dir"], "outliers")
-                )
-                testfile.close()
-            except Exception as e:
-                logging.error(
-                    "ERROR: "
-                    + os.path.join(argsDict["output_dir"], "outliers")
-                    + " not writeable"
-                )
-                logging.error("Reason: " + str(e))
-                raise
+        _check_output_subdirectory(argsDict["output_dir"], "outliers")
 
     # check if outlier-table exists if it was given, otherwise exit
     if argsDict["outlier_table"] is not None:
@@ -1757,8 +1571,7 @@ def _do_fsqc(argsDict):
                 screenshots_outdir = os.path.join(
                     argsDict["output_dir"], "screenshots", subject
                 )
-                if not os.path.isdir(screenshots_outdir):
-                    os.makedirs(screenshots_outdir)
+                os.makedirs(screenshots_outdir, exist_ok=True)
                 outfile = os.path.join(screenshots_outdir, subject + ".png")
 
                 # re-initialize
@@ -1929,8 +1742,7 @@ def _do_fsqc(argsDict):
                 surfaces_outdir = os.path.join(
                     argsDict["output_dir"], "surfaces", subject
                 )
-                if not os.path.isdir(surfaces_outdir):
-                    os.makedirs(surfaces_outdir)
+                os.makedirs(surfaces_outdir, exist_ok=True)
 
                 # process
                 createSurfacePlots(
@@ -1975,8 +1787,7 @@ def _do_fsqc(argsDict):
                 skullstrip_outdir = os.path.join(
                     argsDict["output_dir"], "skullstrip", subject
                 )
-                if not os.path.isdir(skullstrip_outdir):
-                    os.makedirs(skullstrip_outdir)
+                os.makedirs(skullstrip_outdir, exist_ok=True)
                 outfile = os.path.join(skullstrip_outdir, subject + ".png")
 
                 # re-initialize
@@ -2066,8 +1877,7 @@ def _do_fsqc(argsDict):
 
                 # check / create subject-specific fornix_outdir
                 fornix_outdir = os.path.join(argsDict["output_dir"], "fornix", subject)
-                if not os.path.isdir(fornix_outdir):
-                    os.makedirs(fornix_outdir)
+                os.makedirs(fornix_outdir, exist_ok=True)
                 fornix_screenshot_outfile = os.path.join(fornix_outdir, "cc.png")
 
                 # process
@@ -2138,8 +1948,7 @@ def _do_fsqc(argsDict):
                 hypothalamus_outdir = os.path.join(
                     argsDict["output_dir"], "hypothalamus", subject
                 )
-                if not os.path.isdir(hypothalamus_outdir):
-                    os.makedirs(hypothalamus_outdir)
+                os.makedirs(hypothalamus_outdir, exist_ok=True)
                 hypothalamus_screenshot_outfile = os.path.join(
                     hypothalamus_outdir, "hypothalamus.png"
                 )
@@ -2191,8 +2000,7 @@ def _do_fsqc(argsDict):
                 hippocampus_outdir = os.path.join(
                     argsDict["output_dir"], "hippocampus", subject
                 )
-                if not os.path.isdir(hippocampus_outdir):
-                    os.makedirs(hippocampus_outdir)
+                os.makedirs(hippocampus_outdir, exist_ok=True)
                 hippocampus_screenshot_outfile_left = os.path.join(
                     hippocampus_outdir, "hippocampus-left.png"
                 )
@@ -2842,7 +2650,6 @@ def _start_logging(argsDict):
     import logging
     import os
     import sys
-    import tempfile
     import time
     import traceback
 
@@ -2871,7 +2678,7 @@ def _start_logging(argsDict):
         logging.info("Found output directory " + argsDict["output_dir"])
     else:
         try:
-            os.mkdir(argsDict["output_dir"])
+            os.makedirs(argsDict["output_dir"], exist_ok=True)
         except Exception as e:
             logging.error(
                 "ERROR: cannot create output directory " + argsDict["output_dir"]
@@ -2880,13 +2687,8 @@ def _start_logging(argsDict):
             raise
 
     # check if logfile can be written in output directory
-    try:
-        testfile = tempfile.TemporaryFile(dir=argsDict["output_dir"])
-        testfile.close()
-    except Exception as e:
-        logging.error("ERROR: " + argsDict["output_dir"] + " not writeable")
-        logging.error("Reason: " + str(e))
-        raise
+    if not os.access(argsDict["output_dir"], os.W_OK | os.X_OK):
+        raise PermissionError("ERROR: " + argsDict["output_dir"] + " not writeable")
 
     #
     logfile = os.path.join(argsDict["output_dir"], "logfile.txt")
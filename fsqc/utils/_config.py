@@ -5,8 +5,6 @@ from functools import partial
 from importlib.metadata import requires, version
 from typing import IO, Callable, List, Optional
 
-import psutil
-
 
 def sys_info(fid: Optional[IO] = None, developer: bool = False):
     """Print the system information for debugging.
@@ -19,6 +17,8 @@ def sys_info(fid: Optional[IO] = None, developer: bool = False):
     developer : bool, default=False
         If True, display information about optional dependencies.
     """
+    # psutil is only needed here; importing it lazily keeps 'import fsqc' light
+    import psutil
 
     ljust = 26
     out = partial(print, end="", file=fid)